@@ -0,0 +1,43 @@
+# src/backtest.py
+
+from evaluation.backtester import FightBacktester
+import argparse
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest MMAFightPredictor on archived cards with known winners")
+    parser.add_argument('cards', nargs='+', help="Archived card JSON files (event_data.json format plus a 'winner' per fight)")
+    parser.add_argument('--model', action='append', dest='models', help="Ollama model to evaluate (repeat to compare several)")
+    parser.add_argument('--workers', type=int, default=4, help="Number of worker processes")
+    parser.add_argument('--cache', default=None, help="JSON file used to cache predictions between runs")
+    args = parser.parse_args()
+    
+    backtester = FightBacktester(max_workers=args.workers, cache_path=args.cache)
+    fights = backtester.load_cards(args.cards)
+    
+    print(f"Loaded {len(fights)} fights with known outcomes.")
+    
+    configs = [
+        {'name': model, 'predictor_kwargs': {'model': model}}
+        for model in (args.models or ['mistral'])
+    ]
+    
+    reports = backtester.run(fights, configs)
+    
+    print("\nBacktest Results:")
+    print("================")
+    for report in reports:
+        print(f"\nConfiguration: {report['config']}")
+        print(f"Fights: {report['fights']} ({report['cached']} cached, {report['scored']} scored)")
+        print(f"Errors: {report['errors']} (error rate {_format(report['error_rate'])})")
+        print(f"Accuracy: {_format(report['accuracy'])}")
+        print(f"Brier Score: {_format(report['brier_score'])}")
+        print(f"Log-Loss: {_format(report['log_loss'])}")
+        print(f"Startup: {_format(report['startup_seconds'])} sec")
+        print(f"Throughput: {_format(report['fights_per_second'])} fights/sec (steady state)")
+        print(f"Mean Latency: {_format(report['mean_latency_seconds'])} sec")
+
+def _format(value) -> str:
+    return 'N/A' if value is None else f"{value:.3f}"
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
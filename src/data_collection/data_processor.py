@@ -1,7 +1,30 @@
 # src/data_collection/data_processor.py
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import json
+import pandas as pd
+
+# Tale of the tape keys collected per fighter for the columnar output
+FRAME_COLUMNS = {
+    'stance': 'Stance',
+    'record': 'Wins/Losses/Draws',
+    'height': 'Height',
+    'reach': 'Reach',
+    'dob': 'DOB',
+    'weight': 'Weight',
+    'slpm': 'Strikes Landed per Min. (SLpM)',
+    'sapm': 'Strikes Absorbed per Min. (SApM)',
+    'str_acc': 'Striking Accuracy',
+    'str_def': 'Defense',
+    'td_avg': 'Takedowns Average/15 min.',
+    'td_acc': 'Takedown Accuracy',
+    'td_def': 'Takedown Defense',
+    'sub_avg': 'Submission Average/15 min.',
+    'avg_fight_time': 'Average Fight Time'
+}
+
+RATE_COLUMNS = ['slpm', 'sapm', 'td_avg', 'sub_avg']
+PERCENT_COLUMNS = ['str_acc', 'str_def', 'td_acc', 'td_def']
 
 class FightDataProcessor:
     def __init__(self):
@@ -50,22 +73,28 @@ class FightDataProcessor:
             'reach': stats.get('Reach', {}).get(fighter_name),
             'age': stats.get('DOB', {}).get(fighter_name),
             'striking_stats': {
-                'strikes_landed_per_min': float(stats.get('Strikes Landed per Min. (SLpM)', {}).get(fighter_name, 0)),
-                'strikes_absorbed_per_min': float(stats.get('Strikes Absorbed per Min. (SApM)', {}).get(fighter_name, 0)),
+                'strikes_landed_per_min': self._parse_rate(stats.get('Strikes Landed per Min. (SLpM)', {}).get(fighter_name)),
+                'strikes_absorbed_per_min': self._parse_rate(stats.get('Strikes Absorbed per Min. (SApM)', {}).get(fighter_name)),
                 'striking_accuracy': stats.get('Striking Accuracy', {}).get(fighter_name),
                 'defense': stats.get('Defense', {}).get(fighter_name)
             },
             'grappling_stats': {
-                'takedowns_per_15min': float(stats.get('Takedowns Average/15 min.', {}).get(fighter_name, 0)),
+                'takedowns_per_15min': self._parse_rate(stats.get('Takedowns Average/15 min.', {}).get(fighter_name)),
                 'takedown_accuracy': stats.get('Takedown Accuracy', {}).get(fighter_name),
                 'takedown_defense': stats.get('Takedown Defense', {}).get(fighter_name),
-                'submissions_per_15min': float(stats.get('Submission Average/15 min.', {}).get(fighter_name, 0))
+                'submissions_per_15min': self._parse_rate(stats.get('Submission Average/15 min.', {}).get(fighter_name))
             },
             'fight_metrics': {
                 'avg_fight_time': stats.get('Average Fight Time', {}).get(fighter_name)
             }
         }
 
+    def _parse_rate(self, value: Any) -> Optional[float]:
+        """
+        Convert a per-minute rate to float, keeping missing stats as None
+        """
+        return float(value) if value is not None else None
+
     def _extract_matchup_details(self, stats: Dict, fighter1: str, fighter2: str) -> Dict:
         """
         Extract relevant matchup details and recent fight history
@@ -78,4 +107,122 @@ class FightDataProcessor:
                 'fighter1': {k: stats[k].get(fighter1) for k in history_keys if stats[k].get(fighter1)},
                 'fighter2': {k: stats[k].get(fighter2) for k in history_keys if stats[k].get(fighter2)}
             }
-        }
\ No newline at end of file
+        }
+
+    def process_fight_frame(self, raw_data: List[Dict], reference_date: Optional[str] = None) -> pd.DataFrame:
+        """
+        Process raw fight data into a DataFrame with one row per fight.
+        Fighter columns are prefixed f1_/f2_, missing stats are NaN, and
+        derived matchup columns are computed vectorized over the whole card.
+        """
+        columns = {'fighter1': [], 'fighter2': []}
+        for prefix in ('f1_', 'f2_'):
+            for name in FRAME_COLUMNS:
+                columns[prefix + name] = []
+
+        # Single pass over the card collecting the raw values
+        for fight in raw_data:
+            matchup = fight.get('matchup', [])
+            stats = fight.get('tale_of_the_tape', {})
+
+            if len(matchup) != 2:
+                continue
+
+            fighter1, fighter2 = matchup
+            columns['fighter1'].append(fighter1)
+            columns['fighter2'].append(fighter2)
+
+            for name, key in FRAME_COLUMNS.items():
+                values = stats.get(key, {})
+                columns['f1_' + name].append(values.get(fighter1))
+                columns['f2_' + name].append(values.get(fighter2))
+
+        frame = pd.DataFrame(columns, dtype=object)
+        frame['weight_class'] = frame['f1_weight'].fillna('Unknown')
+
+        reference = pd.Timestamp(reference_date) if reference_date else pd.Timestamp.today().normalize()
+
+        for prefix in ('f1_', 'f2_'):
+            for name in RATE_COLUMNS:
+                frame[prefix + name] = self._parse_numeric_column(frame[prefix + name])
+            for name in PERCENT_COLUMNS:
+                frame[prefix + name] = self.parse_percent_column(frame[prefix + name])
+
+            frame[prefix + 'height_in'] = self._parse_height_column(frame[prefix + 'height'])
+            frame[prefix + 'reach_in'] = self._parse_numeric_column(frame[prefix + 'reach'], suffix='"')
+            dob = pd.to_datetime(frame[prefix + 'dob'], format='%b %d, %Y', errors='coerce')
+            frame[prefix + 'age'] = (reference - dob).dt.days / 365.25
+
+        # Derived matchup metrics, always from fighter1's perspective
+        frame['net_strike_diff'] = (
+            (frame['f1_slpm'] - frame['f1_sapm']) - (frame['f2_slpm'] - frame['f2_sapm'])
+        )
+        # Takedowns landed per 15 min scaled by the share the opponent fails to defend
+        frame['f1_td_matchup'] = frame['f1_td_avg'] * (1 - frame['f2_td_def'])
+        frame['f2_td_matchup'] = frame['f2_td_avg'] * (1 - frame['f1_td_def'])
+        frame['td_matchup_diff'] = frame['f1_td_matchup'] - frame['f2_td_matchup']
+        frame['height_delta'] = frame['f1_height_in'] - frame['f2_height_in']
+        frame['reach_delta'] = frame['f1_reach_in'] - frame['f2_reach_in']
+        frame['age_delta'] = frame['f1_age'] - frame['f2_age']
+
+        return frame
+
+    def filter_fights(self, frame: pd.DataFrame, weight_class: Optional[str] = None, **bounds: float) -> pd.DataFrame:
+        """
+        Filter a fight frame with boolean masks, e.g.
+        filter_fights(frame, '185 lbs.', min_reach_delta=2, max_age_delta=0)
+        """
+        mask = pd.Series(True, index=frame.index)
+
+        if weight_class is not None:
+            mask &= frame['weight_class'] == weight_class
+
+        for bound, value in bounds.items():
+            kind, _, column = bound.partition('_')
+            if kind == 'min':
+                mask &= frame[column] >= value
+            elif kind == 'max':
+                mask &= frame[column] <= value
+            else:
+                raise ValueError(f"Bound '{bound}' must start with 'min_' or 'max_'")
+
+        return frame[mask]
+
+    def sort_fights(self, frame: pd.DataFrame, by: str, ascending: bool = False,
+                    top_n: Optional[int] = None, absolute: bool = False) -> pd.DataFrame:
+        """
+        Sort a fight frame by a column, optionally by magnitude (absolute=True)
+        so the largest edges for either fighter come first
+        """
+        key = (lambda column: column.abs()) if absolute else None
+        ordered = frame.sort_values(by, ascending=ascending, key=key, na_position='last')
+        return ordered.head(top_n) if top_n is not None else ordered
+
+    def parse_percent_column(self, column: pd.Series) -> pd.Series:
+        """
+        Convert a column of values like '56%' (or plain 56) into 0-1 fractions
+        """
+        return self._parse_numeric_column(column, suffix='%') / 100
+
+    def _parse_numeric_column(self, column: pd.Series, suffix: str = '') -> pd.Series:
+        """
+        Convert a column of numbers or numeric strings with an optional unit
+        suffix into floats, NaN where missing or unparseable
+        """
+        text = column.astype('string').str.strip()
+        if suffix:
+            text = text.str.rstrip(suffix)
+        return pd.to_numeric(text, errors='coerce').astype(float)
+
+    def _parse_height_column(self, column: pd.Series) -> pd.Series:
+        """
+        Convert a column of heights like 5' 11" into inches, plain numbers are
+        taken as inches already
+        """
+        text = column.astype('string')
+        parts = text.str.extract(r"(\d+)'\s*(\d+)")
+        feet_inches = (
+            pd.to_numeric(parts[0], errors='coerce').astype(float) * 12
+            + pd.to_numeric(parts[1], errors='coerce').astype(float)
+        )
+        return feet_inches.fillna(self._parse_numeric_column(text, suffix='"'))
\ No newline at end of file
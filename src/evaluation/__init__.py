@@ -0,0 +1,4 @@
+# src/evaluation/__init__.py
+from .backtester import FightBacktester
+
+__all__ = ['FightBacktester']
\ No newline at end of file
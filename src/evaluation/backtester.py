@@ -0,0 +1,239 @@
+# src/evaluation/backtester.py
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+import json
+import math
+import os
+import time
+
+from data_collection.data_processor import FightDataProcessor
+
+# Probability assigned to the predicted winner for each confidence level
+CONFIDENCE_PROBABILITIES = {
+    'Low': 0.55,
+    'Medium': 0.65,
+    'High': 0.8
+}
+
+# Predictor instance owned by each worker process
+_worker_predictor = None
+
+def _init_worker(predictor_kwargs: Dict):
+    """
+    Create one predictor per worker process so agent state is never shared
+    """
+    global _worker_predictor
+    from prediction.mma_predictor import MMAFightPredictor
+    _worker_predictor = MMAFightPredictor(**predictor_kwargs)
+
+def _predict_fight(fight_data: Dict) -> Dict:
+    """
+    Run a single prediction inside a worker process. Wall-clock start and
+    finish times are recorded so throughput can be measured across workers.
+    """
+    started_at = time.time()
+    start = time.perf_counter()
+    try:
+        result = _worker_predictor.predict_winner(fight_data)
+        error = None
+    except Exception as e:
+        result = None
+        error = str(e)
+
+    return {
+        'prediction': result['prediction'] if result else None,
+        'error': error,
+        'latency': time.perf_counter() - start,
+        'started_at': started_at,
+        'finished_at': time.time()
+    }
+
+class FightBacktester:
+    def __init__(self, max_workers: int = 4, cache_path: Optional[str] = None):
+        self.processor = FightDataProcessor()
+        self.max_workers = max_workers
+        self.cache_path = cache_path
+        self.cache = self._load_cache()
+
+    def load_cards(self, card_paths: List[str]) -> List[Dict]:
+        """
+        Load archived cards and keep only fights with a known winner
+        """
+        fights = []
+
+        for path in card_paths:
+            with open(path, 'r') as f:
+                card = json.load(f)
+
+            for raw_fight in card:
+                winner = raw_fight.get('winner')
+                processed = self.processor.process_fight_data([raw_fight])
+
+                # Skip fights without a decisive, named result
+                if not processed or winner not in raw_fight.get('matchup', []):
+                    continue
+
+                fights.append({
+                    'event': os.path.abspath(path),
+                    'fight_data': processed[0],
+                    'winner': winner
+                })
+
+        return fights
+
+    def run(self, fights: List[Dict], configs: List[Dict]) -> List[Dict]:
+        """
+        Replay the fights through each predictor configuration and report metrics.
+        Each config is a dict with a 'name' and optional 'predictor_kwargs'.
+        """
+        reports = []
+
+        for config in configs:
+            # Persist completed predictions even if a later config crashes or is interrupted
+            try:
+                reports.append(self._run_config(fights, config))
+            finally:
+                self._save_cache()
+
+        return reports
+
+    def _run_config(self, fights: List[Dict], config: Dict) -> Dict:
+        """
+        Run one configuration over all fights using a process pool
+        """
+        name = config['name']
+        predictor_kwargs = config.get('predictor_kwargs', {})
+
+        results = [None] * len(fights)
+        pending = []
+
+        for i, fight in enumerate(fights):
+            cached = self.cache.get(self._cache_key(config, fight))
+            if cached is not None:
+                results[i] = dict(cached, cached=True)
+            else:
+                pending.append(i)
+
+        pool_started_at = time.time()
+        if pending:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(predictor_kwargs,)
+            ) as executor:
+                outputs = executor.map(_predict_fight, [fights[i]['fight_data'] for i in pending])
+
+                for i, output in zip(pending, outputs):
+                    results[i] = dict(output, cached=False)
+                    if output['error'] is None:
+                        self.cache[self._cache_key(config, fights[i])] = output
+        elapsed = time.time() - pool_started_at
+
+        errors = sum(1 for r in results if r['error'] is not None)
+        completed = sum(1 for i in pending if results[i]['error'] is None)
+
+        # Process spawn and agent construction in _init_worker happen before the
+        # first task starts, so they are reported as startup, not throughput
+        startup = None
+        steady_state = None
+        if pending:
+            first_start = min(results[i]['started_at'] for i in pending)
+            last_finish = max(results[i]['finished_at'] for i in pending)
+            startup = first_start - pool_started_at
+            steady_state = last_finish - first_start
+
+        report = self._score(fights, results)
+        report.update({
+            'config': name,
+            'fights': len(fights),
+            'predicted': len(pending),
+            'cached': len(fights) - len(pending),
+            'errors': errors,
+            'error_rate': errors / len(fights) if fights else None,
+            'elapsed_seconds': elapsed,
+            'startup_seconds': startup,
+            'steady_state_seconds': steady_state,
+            'fights_per_second': completed / steady_state if completed and steady_state else None
+        })
+
+        return report
+
+    def _score(self, fights: List[Dict], results: List[Dict]) -> Dict:
+        """
+        Compute accuracy, Brier score and log-loss from fighter1's win probability.
+        Errored predictions are left out so failures don't skew the quality metrics.
+        """
+        correct = 0
+        brier = 0.0
+        log_loss = 0.0
+        latencies = []
+        total = 0
+
+        for fight, result in zip(fights, results):
+            if result['error'] is not None:
+                continue
+
+            total += 1
+            fighter1 = fight['fight_data']['fighter1']['name']
+            outcome = 1.0 if fight['winner'] == fighter1 else 0.0
+            prob = self._fighter1_probability(fighter1, result['prediction'])
+
+            if result['prediction'] and result['prediction']['predicted_winner'] == fight['winner']:
+                correct += 1
+
+            brier += (prob - outcome) ** 2
+            prob = min(max(prob, 1e-15), 1 - 1e-15)
+            log_loss -= outcome * math.log(prob) + (1 - outcome) * math.log(1 - prob)
+
+            if not result['cached']:
+                latencies.append(result['latency'])
+
+        return {
+            'scored': total,
+            'accuracy': correct / total if total else None,
+            'brier_score': brier / total if total else None,
+            'log_loss': log_loss / total if total else None,
+            'mean_latency_seconds': sum(latencies) / len(latencies) if latencies else None
+        }
+
+    def _fighter1_probability(self, fighter1: str, prediction: Optional[Dict]) -> float:
+        """
+        Convert a predicted winner and confidence level into P(fighter1 wins)
+        """
+        if not prediction or not prediction.get('predicted_winner'):
+            return 0.5
+
+        prob = CONFIDENCE_PROBABILITIES.get(prediction.get('confidence'), CONFIDENCE_PROBABILITIES['Medium'])
+        return prob if prediction['predicted_winner'] == fighter1 else 1 - prob
+
+    def _cache_key(self, config: Dict, fight: Dict) -> str:
+        """
+        Key cached predictions by configuration name and kwargs, card path and matchup
+        """
+        fight_data = fight['fight_data']
+        predictor_kwargs = json.dumps(config.get('predictor_kwargs', {}), sort_keys=True)
+        return "|".join([
+            config['name'],
+            predictor_kwargs,
+            fight['event'],
+            fight_data['fighter1']['name'],
+            fight_data['fighter2']['name']
+        ])
+
+    def _load_cache(self) -> Dict:
+        """
+        Load previously cached predictions if a cache file is configured
+        """
+        if self.cache_path and os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def _save_cache(self):
+        """
+        Persist cached predictions if a cache file is configured
+        """
+        if self.cache_path:
+            with open(self.cache_path, 'w') as f:
+                json.dump(self.cache, f, indent=2)
@@ -3,6 +3,7 @@
 from data_collection.data_processor import FightDataProcessor
 from analysis.mma_agent import MMAAnalysisAgent
 from prediction.mma_predictor import MMAFightPredictor
+from prediction.matchup_screener import WeightClassMatchupScreener
 import json
 
 def main():
@@ -37,6 +38,7 @@ def main():
         print("1. Analyze the fight")
         print("2. Predict the winner")
         print("3. Both analyze and predict")
+        print("4. Screen all matchups in this weight class")
         option = int(input("\nWhat would you like to do? (Enter number): "))
         
         if option == 1 or option == 3:
@@ -62,6 +64,27 @@ def main():
             print(f"Confidence Level: {confidence}")
             print("\nFull Analysis:")
             print(prediction['full_analysis'])
+        
+        if option == 4:
+            # Score every pairing in the weight class, then predict only the closest ones
+            top_k = int(input("\nHow many of the closest matchups should be predicted? (Enter number): "))
+            screener = WeightClassMatchupScreener(predictor)
+            
+            print("\nScreening matchups...")
+            screening = screener.screen(processed_fights, selected_fight['weight_class'], top_k=top_k)
+            
+            print("\nScreening Results:")
+            print("=================")
+            print(f"Fighters in {screening['weight_class']}: {screening['roster_size']}")
+            print(f"Pairings scored: {screening['pairings_scored']}")
+            
+            for entry in screening['predictions']:
+                matchup = entry['matchup']
+                prediction = entry['result']['prediction']
+                print(f"\n{matchup['fighter1']['name']} vs {matchup['fighter2']['name']}")
+                print(f"Baseline Win Probability ({matchup['fighter1']['name']}): {matchup['fighter1_win_probability']:.2f}")
+                print(f"Predicted Winner: {prediction['predicted_winner']}")
+                print(f"Confidence Level: {prediction['confidence']}")
             
     else:
         print("Invalid fight selection.")
@@ -1,4 +1,5 @@
 # src/prediction/__init__.py
 from .mma_predictor import MMAFightPredictor
+from .matchup_screener import WeightClassMatchupScreener
 
-__all__ = ['MMAFightPredictor']
\ No newline at end of file
+__all__ = ['MMAFightPredictor', 'WeightClassMatchupScreener']
\ No newline at end of file
@@ -0,0 +1,212 @@
+# src/prediction/matchup_screener.py
+
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from data_collection.data_processor import FightDataProcessor
+
+# Per-fighter numeric features used for screening, in matrix column order
+FEATURES = ['slpm', 'sapm', 'td_avg', 'td_def', 'sub_avg']
+
+# Weights applied to each edge component before the logistic transform
+EDGE_WEIGHTS = {
+    'striking_edge': 0.35,
+    'grappling_edge': 0.8,
+    'submission_edge': 0.5
+}
+
+class WeightClassMatchupScreener:
+    def __init__(self, predictor: Optional[Any] = None):
+        # Optional MMAFightPredictor used only for the top-k pairings
+        self.predictor = predictor
+        self.processor = FightDataProcessor()
+
+    def build_roster(self, processed_fights: List[Dict], weight_class: str) -> List[Dict]:
+        """
+        Collect every unique fighter in a weight class from processed fights
+        """
+        roster = {}
+
+        for fight in processed_fights:
+            if fight.get('weight_class') != weight_class:
+                continue
+
+            recent = fight.get('matchup_details', {}).get('recent_fights', {})
+
+            for key in ('fighter1', 'fighter2'):
+                fighter = fight[key]
+                if fighter['name'] not in roster:
+                    roster[fighter['name']] = {
+                        'name': fighter['name'],
+                        'stats': fighter['stats'],
+                        'recent_fights': recent.get(key, {})
+                    }
+
+        return list(roster.values())
+
+    def screen(self, processed_fights: List[Dict], weight_class: str, top_k: int = 5) -> Dict:
+        """
+        Score every pairing in a weight class and predict the most competitive ones
+        """
+        roster = self.build_roster(processed_fights, weight_class)
+        features = self._feature_matrix(roster)
+        edges = self.compute_edges(features)
+        rows, cols, competitiveness = self._complete_pairings(edges['win_probability'])
+
+        # Only the top-k pairings are turned into dicts
+        top_matchups = [
+            self._matchup_entry(roster, edges, rows[idx], cols[idx])
+            for idx in self._top_k_indices(competitiveness, top_k)
+        ]
+
+        predictions = []
+        if self.predictor is not None:
+            for matchup in top_matchups:
+                fight_data = self._build_fight_data(matchup, weight_class)
+                predictions.append({
+                    'matchup': matchup,
+                    'result': self.predictor.predict_winner(fight_data)
+                })
+
+        missing = np.isnan(features).any(axis=1)
+
+        return {
+            'weight_class': weight_class,
+            'roster_size': len(roster),
+            'incomplete_fighters': [fighter['name'] for fighter, is_missing in zip(roster, missing) if is_missing],
+            'pairings_scored': len(competitiveness),
+            'top_matchups': top_matchups,
+            'predictions': predictions
+        }
+
+    def rank_matchups(self, roster: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Rank all unique pairings from most to least competitive as arrays of
+        roster indices and fighter1 win probabilities.
+        Pairings involving a fighter with missing stats are left out.
+        """
+        edges = self.compute_edges(self._feature_matrix(roster))
+        rows, cols, competitiveness = self._complete_pairings(edges['win_probability'])
+        order = np.argsort(competitiveness, kind='stable')
+
+        return {
+            'fighter1_index': rows[order],
+            'fighter2_index': cols[order],
+            'fighter1_win_probability': edges['win_probability'][rows[order], cols[order]]
+        }
+
+    def compute_edges(self, features: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute N x N edge and win probability matrices from the roster features.
+        Entry [i, j] is from the perspective of fighter i facing fighter j.
+        """
+        col = {name: features[:, idx] for idx, name in enumerate(FEATURES)}
+
+        # Net strike differential, strikes landed minus strikes absorbed per minute
+        net_striking = col['slpm'] - col['sapm']
+        striking_edge = net_striking[:, None] - net_striking[None, :]
+
+        # Takedowns landed per 15 min scaled by the share the opponent fails to defend,
+        # the same formula as td_matchup in FightDataProcessor.process_fight_frame
+        expected_tds = col['td_avg'][:, None] * (1 - col['td_def'][None, :])
+        grappling_edge = expected_tds - expected_tds.T
+
+        submission_edge = col['sub_avg'][:, None] - col['sub_avg'][None, :]
+
+        total_edge = (
+            EDGE_WEIGHTS['striking_edge'] * striking_edge
+            + EDGE_WEIGHTS['grappling_edge'] * grappling_edge
+            + EDGE_WEIGHTS['submission_edge'] * submission_edge
+        )
+
+        return {
+            'striking_edge': striking_edge,
+            'grappling_edge': grappling_edge,
+            'submission_edge': submission_edge,
+            'total_edge': total_edge,
+            'win_probability': 1 / (1 + np.exp(-total_edge))
+        }
+
+    def _complete_pairings(self, win_prob: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Upper-triangle pairings without missing stats and their distance from 50/50
+        """
+        # Each pairing appears twice in the N x N matrices, keep the upper triangle
+        rows, cols = np.triu_indices(len(win_prob), k=1)
+
+        # Missing stats propagate as NaN, so drop those pairings before ranking
+        complete = ~np.isnan(win_prob[rows, cols])
+        rows, cols = rows[complete], cols[complete]
+
+        return rows, cols, np.abs(win_prob[rows, cols] - 0.5)
+
+    def _top_k_indices(self, competitiveness: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        Indices of the k most competitive pairings, most competitive first
+        """
+        if top_k <= 0 or len(competitiveness) == 0:
+            return np.array([], dtype=int)
+
+        if top_k < len(competitiveness):
+            candidates = np.argpartition(competitiveness, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(len(competitiveness))
+
+        # Sort by competitiveness, breaking ties by pairing order
+        return candidates[np.lexsort((candidates, competitiveness[candidates]))]
+
+    def _matchup_entry(self, roster: List[Dict], edges: Dict[str, np.ndarray], i: int, j: int) -> Dict:
+        """
+        Build the result dict for a single pairing
+        """
+        return {
+            'fighter1': roster[i],
+            'fighter2': roster[j],
+            'fighter1_win_probability': float(edges['win_probability'][i, j]),
+            'striking_edge': float(edges['striking_edge'][i, j]),
+            'grappling_edge': float(edges['grappling_edge'][i, j]),
+            'submission_edge': float(edges['submission_edge'][i, j]),
+            'total_edge': float(edges['total_edge'][i, j])
+        }
+
+    def _feature_matrix(self, roster: List[Dict]) -> np.ndarray:
+        """
+        Build an N x len(FEATURES) matrix from the roster stats, NaN where missing.
+        Rates are already floats (or None) from FightDataProcessor.
+        """
+        rates = np.array([
+            [
+                fighter['stats']['striking_stats']['strikes_landed_per_min'],
+                fighter['stats']['striking_stats']['strikes_absorbed_per_min'],
+                fighter['stats']['grappling_stats']['takedowns_per_15min'],
+                fighter['stats']['grappling_stats']['submissions_per_15min']
+            ]
+            for fighter in roster
+        ], dtype=float).reshape(-1, 4)
+
+        td_def = self.processor.parse_percent_column(pd.Series(
+            [fighter['stats']['grappling_stats']['takedown_defense'] for fighter in roster],
+            dtype=object
+        )).to_numpy()
+
+        return np.column_stack([rates[:, 0], rates[:, 1], rates[:, 2], td_def, rates[:, 3]])
+
+    def _build_fight_data(self, matchup: Dict, weight_class: str) -> Dict:
+        """
+        Build a fight dict in the FightDataProcessor format for MMAFightPredictor
+        """
+        f1 = matchup['fighter1']
+        f2 = matchup['fighter2']
+
+        return {
+            'fighter1': {'name': f1['name'], 'stats': f1['stats']},
+            'fighter2': {'name': f2['name'], 'stats': f2['stats']},
+            'weight_class': weight_class,
+            'matchup_details': {
+                'recent_fights': {
+                    'fighter1': f1['recent_fights'],
+                    'fighter2': f2['recent_fights']
+                }
+            }
+        }
@@ -9,9 +9,9 @@ from typing import Dict, List, Tuple
 import json
 
 class MMAFightPredictor:
-    def __init__(self):
+    def __init__(self, model: str = "mistral"):
         # Initialize Ollama LLM
-        self.llm = Ollama(model="mistral")
+        self.llm = Ollama(model=model)
         self.current_fight_data = None
         
         # Define prediction tools